@@ -40,6 +40,12 @@ const readJson = async (filePath) => {
   return JSON.parse(raw);
 };
 
+const writeJsonAtomic = async (filePath, value) => {
+  const tempPath = `${filePath}.tmp`;
+  await fs.writeFile(tempPath, `${JSON.stringify(value, null, 2)}\n`, "utf8");
+  await fs.rename(tempPath, filePath);
+};
+
 const areArraysEqual = (left = [], right = []) => {
   if (left.length !== right.length) {
     return false;
@@ -47,8 +53,6 @@ const areArraysEqual = (left = [], right = []) => {
   return left.every((value, index) => value === right[index]);
 };
 
-const normalizeRecord = (record) => JSON.parse(JSON.stringify(record));
-
 const main = async () => {
   const { args, flags } = parseArgs(process.argv.slice(2));
   const candidatesPath = args.get("candidates") || DEFAULT_CANDIDATES_PATH;
@@ -118,10 +122,7 @@ const main = async () => {
       themesUnchangedCount += 1;
     }
 
-    const normalizedExisting = normalizeRecord(existing);
-    const normalizedMerged = normalizeRecord(merged);
-    const hasChanges =
-      JSON.stringify(normalizedExisting) !== JSON.stringify(normalizedMerged);
+    const hasChanges = JSON.stringify(existing) !== JSON.stringify(merged);
 
     if (hasChanges) {
       productions[existingIndex] = merged;
@@ -147,11 +148,7 @@ const main = async () => {
     return;
   }
 
-  await fs.writeFile(
-    resolvedOutputPath,
-    `${JSON.stringify(productions, null, 2)}\n`,
-    "utf8"
-  );
+  await writeJsonAtomic(resolvedOutputPath, productions);
 };
 
 main().catch((error) => {